@@ -1,8 +1,11 @@
-from .capture import CameraFrameCapture
+from .capture import LazyRGBFrame, CameraFrameCapture
+from .async_capture import AsyncCameraFrameCapture
 from .exceptions import FrameSaveError
 
 __all__ = [
     "CameraFrameCapture",
+    "AsyncCameraFrameCapture",
+    "LazyRGBFrame",
     "CameraOpenError"
     "CameraReadError",
     "FrameSaveError",
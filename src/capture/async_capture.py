@@ -0,0 +1,185 @@
+import time
+import threading
+import contextlib
+from pathlib import Path
+from collections import deque
+from collections.abc import Iterable, Iterator
+
+import numpy as np
+
+from src.configs.camera import CameraConfig
+
+from .capture import CameraFrameCapture
+from .exceptions import CameraReadError
+
+
+class AsyncCameraFrameCapture(Iterable[np.ndarray]):
+    """Асинхронная обертка над CameraFrameCapture.
+
+    Фоновый поток непрерывно считывает кадры в кольцевой буфер фиксированной длины
+    (старые кадры вытесняются новыми). Медленный потребитель при этом всегда получает
+    свежий кадр вместо накопления задержки во внутреннем буфере VideoCapture.
+    """
+
+    def __init__(
+        self,
+        config: CameraConfig | None = None,
+        buffer_len: int = 1,
+        drop_old: bool = True,
+    ):
+        """
+        :param CameraConfig | None config: Параметры инициализации камеры
+        :param int buffer_len: Длина кольцевого буфера кадров
+        :param bool drop_old: Если True - read() сразу возвращает последний кадр,
+            если False - ожидает поступления нового кадра
+        """
+        self._capture = CameraFrameCapture(config)
+        self.drop_old = drop_old
+
+        self._buffer: deque[np.ndarray] = deque(maxlen=buffer_len)
+        self._lock = threading.Lock()
+        self._cv = threading.Condition(self._lock)
+        self._thread: threading.Thread | None = None
+        self._run: bool = False
+        self._error: Exception | None = None
+
+        self._frames_read: int = 0
+        self._drops: int = 0
+        self._read_started: float | None = None
+
+    def stats(self) -> dict[str, float]:
+        """Возвращает метрики фонового захвата
+
+        :return dict[str, float]: Словарь метрик: read_fps - частота считывания кадров,
+            queue_depth_read - текущее заполнение кольцевого буфера,
+            drops - количество кадров, вытесненных из буфера непрочитанными
+        """
+        with self._cv:
+            elapsed = time.monotonic() - self._read_started if self._read_started is not None else 0.0
+
+            return {
+                'frames_read': float(self._frames_read),
+                'read_fps': self._frames_read / elapsed if elapsed > 0 else 0.0,
+                'queue_depth_read': float(len(self._buffer)),
+                'drops': float(self._drops),
+            }
+
+    @property
+    def config(self) -> CameraConfig:
+        return self._capture.config
+
+    def open(self) -> None:
+        """Выполняет подключение к источнику видео и запускает фоновое считывание
+
+        :raises CameraOpenError: При ошибке подключения к источнику видео
+        """
+        if self._run:
+            return
+
+        self._capture.open()
+        self._error = None
+        self._run = True
+        self._thread = threading.Thread(target=self._capture_loop, daemon=True)
+        self._thread.start()
+
+    def close(self) -> None:
+        """Останавливает фоновое считывание и отключается от источника видео"""
+
+        self._run = False
+
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+
+        self._capture.close()
+
+        with self._cv:
+            self._buffer.clear()
+            self._error = None
+
+    def _capture_loop(self) -> None:
+        """Цикл фонового потока: считывает кадры в кольцевой буфер"""
+
+        while self._run:
+            try:
+                # Копия обязательна: кадры в кольцевом буфере должны пережить
+                # ротацию буферного пула read()
+                frame = self._capture.read(copy=True)
+            except Exception as error:
+                with self._cv:
+                    self._error = error
+                    self._run = False
+                    self._cv.notify_all()
+                break
+
+            with self._cv:
+                if self._read_started is None:
+                    self._read_started = time.monotonic()
+
+                if len(self._buffer) == self._buffer.maxlen:
+                    # Буфер полон - append вытеснит самый старый кадр
+                    self._drops += 1
+
+                self._frames_read += 1
+                self._buffer.append(frame)
+                self._cv.notify_all()
+
+    def read(self, timeout: float | None = None) -> np.ndarray:
+        """Возвращает последний считанный кадр
+
+        :param float | None timeout: Максимальное время ожидания кадра в секундах
+        :raises CameraReadError: При ошибке считывания кадра или истечении времени ожидания
+        :return np.ndarray: Полученный кадр
+        """
+        if not self._run:
+            # Захват, остановившийся из-за ошибки, не перезапускается молча:
+            # переподключение - явное решение вызывающего кода (close + open)
+            if self._error is not None:
+                raise self._error
+
+            self.open()
+
+        with self._cv:
+            # Ошибка фонового потока проверяется до быстрого пути, иначе
+            # мертвый источник бесконечно маскируется устаревшим кадром
+            if self._error is not None:
+                raise self._error
+
+            if self.drop_old and self._buffer:
+                return self._buffer[-1]
+
+            if not self._cv.wait_for(lambda: self._buffer or not self._run, timeout=timeout):
+                raise CameraReadError("Истекло время ожидания кадра")
+
+            if self._error is not None:
+                raise self._error
+
+            if not self._buffer:
+                raise CameraReadError("Не удалось прочитать кадр из источника")
+
+            return self._buffer.popleft() if not self.drop_old else self._buffer[-1]
+
+    def save_frame(self, frame: np.ndarray, file_path: str | Path) -> Path:
+        """Сохраняет кадр по указанному пути
+
+        :param np.ndarray frame: Кадр для сохранения
+        :param str | Path file_path: Путь к файлу для сохранения
+        :raises FrameSaveError: При ошибке сохранения кадра
+        :return Path: Путь к сохраненному файлу
+        """
+        return self._capture.save_frame(frame, file_path)
+
+    def __enter__(self) -> "AsyncCameraFrameCapture":
+        self.open()
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        self.close()
+
+    def __iter__(self) -> Iterator[np.ndarray]:
+        if not self._run:
+            self.open()
+
+        with contextlib.suppress(CameraReadError):
+            while self._run:
+                yield self.read()
@@ -1,4 +1,7 @@
+import os
 import time
+import queue
+import threading
 import contextlib
 from pathlib import Path
 from collections.abc import Iterable, Iterator
@@ -10,13 +13,73 @@ from src.configs.camera import CameraConfig
 
 from .exceptions import FrameSaveError, CameraOpenError, CameraReadError
 
+# Ограничиваем внутренний пул OpenCV (TBB/OpenMP) половиной ядер,
+# оставляя остальные потокам кодирования и записи
+cv2.setNumThreads(max(1, (os.cpu_count() or 1) // 2))
+
+
+class LazyRGBFrame:
+    """BGR-кадр с отложенной конвертацией в RGB.
+
+    Конвертация выполняется один раз при первом обращении к свойству rgb.
+    Потребители, которым достаточно BGR (например, сохранение через cv2.imwrite),
+    вообще не платят за cvtColor. Сама конвертация выполняется векторизованным
+    путем OpenCV (wide universal intrinsics в сборках wheel с AVX2/SSE).
+    """
+
+    __slots__ = ("bgr", "_rgb")
+
+    def __init__(self, bgr: np.ndarray):
+        self.bgr = bgr
+        self._rgb: np.ndarray | None = None
+
+    @property
+    def rgb(self) -> np.ndarray:
+        if self._rgb is None:
+            self._rgb = cv2.cvtColor(self.bgr, cv2.COLOR_BGR2RGB)
+        return self._rgb
+
 
 class CameraFrameCapture(Iterable[np.ndarray]):
 
+    # Коэффициент сглаживания EWMA для задержки записи
+    EWMA_ALPHA = 0.1
+
     def __init__(self, config: CameraConfig | None = None):
         self.config = config or CameraConfig()
         self._cap: cv2.VideoCapture | None = None
         self._is_open: bool = False
+        self._pool: list[np.ndarray | None] = []
+        self._rgb_pool: list[np.ndarray | None] = []
+        self._pool_idx: int = 0
+
+        self._stats_lock = threading.Lock()
+        self._frames_read: int = 0
+        self._drops: int = 0
+        self._read_started: float | None = None
+        self._write_latency_ewma: float = 0.0
+        self._read_q: queue.Queue | None = None
+        self._write_q: queue.Queue | None = None
+
+    def stats(self) -> dict[str, float]:
+        """Возвращает метрики конвейера захвата
+
+        :return dict[str, float]: Словарь метрик: read_fps - частота считывания кадров,
+            queue_depth_read / queue_depth_write - текущие глубины очередей конвейера,
+            io_latency_ms - сглаженная (EWMA) задержка записи на диск,
+            drops - количество пропущенных слотов сохранения
+        """
+        with self._stats_lock:
+            elapsed = time.monotonic() - self._read_started if self._read_started is not None else 0.0
+
+            return {
+                'frames_read': float(self._frames_read),
+                'read_fps': self._frames_read / elapsed if elapsed > 0 else 0.0,
+                'queue_depth_read': float(self._read_q.qsize()) if self._read_q is not None else 0.0,
+                'queue_depth_write': float(self._write_q.qsize()) if self._write_q is not None else 0.0,
+                'io_latency_ms': self._write_latency_ewma,
+                'drops': float(self._drops),
+            }
 
     def open(self) -> None:
         """Выполняет подключение к источнику видео
@@ -27,7 +90,24 @@ class CameraFrameCapture(Iterable[np.ndarray]):
             return
 
         source = self.config.source
-        cap = cv2.VideoCapture(source)
+
+        if isinstance(source, str):
+            # Для файлов и сетевых потоков явно выбираем FFmpeg-бэкенд и просим
+            # аппаратное декодирование (VAAPI/NVDEC), чтобы снять H.264/H.265 с CPU
+            cap = cv2.VideoCapture(
+                source,
+                cv2.CAP_FFMPEG,
+                [
+                    cv2.CAP_PROP_HW_ACCELERATION, cv2.VIDEO_ACCELERATION_ANY,
+                    cv2.CAP_PROP_HW_ACCELERATION_USE_OPENCL, 1,
+                ],
+            )
+
+            if not cap.isOpened():
+                cap.release()
+                cap = cv2.VideoCapture(source)
+        else:
+            cap = cv2.VideoCapture(source)
 
         if not cap.isOpened():
             cap.release()
@@ -42,9 +122,26 @@ class CameraFrameCapture(Iterable[np.ndarray]):
         if self.config.fps is not None:
             cap.set(cv2.CAP_PROP_FPS, float(self.config.fps))
 
+        if self.config.pixel_format in {'GRAY', 'YUV'}:
+            # Запрашиваем сырой формат у драйвера - cvtColor на каждый кадр
+            # не нужен ни в бэкенде, ни в read()
+            cap.set(cv2.CAP_PROP_CONVERT_RGB, 0)
+
+            if self.config.pixel_format == 'GRAY':
+                cap.set(cv2.CAP_PROP_FORMAT, cv2.CV_8UC1)
+
         self._cap = cap
         self._is_open = True
 
+    @property
+    def _wants_rgb(self) -> bool:
+        """Нужно ли конвертировать кадры в RGB с учетом pixel_format"""
+
+        if self.config.pixel_format is not None:
+            return self.config.pixel_format == 'RGB'
+
+        return self.config.convert_to_rgb
+
     def close(self) -> None:
         """Выполняет отключение от источника видео"""
 
@@ -54,22 +151,61 @@ class CameraFrameCapture(Iterable[np.ndarray]):
 
         self._cap = None
         self._is_open = False
+        self._pool = []
+        self._rgb_pool = []
+        self._pool_idx = 0
 
-    def read(self) -> np.ndarray:
+    def read(self, copy: bool = False) -> np.ndarray | LazyRGBFrame:
         """Считывает кадр с видеопотока
 
+        :param bool copy: Вернуть независимую копию кадра. Без копии кадр ссылается
+            на буфер из кольцевого пула и перезаписывается через
+            config.frame_pool_size последующих вызовов read()
         :raises CameraReadError: При ошибке считывания кадра
-        :return np.ndarray: Полученный кадр
+        :return np.ndarray | LazyRGBFrame: Полученный кадр. При
+            config.defer_rgb_conversion=True возвращается LazyRGBFrame, конвертация
+            в RGB откладывается до первого обращения к frame.rgb
         """
         if not self._is_open:
             self.open()
 
-        ok, frame = self._cap.read()
+        if not self._pool:
+            pool_size = max(1, self.config.frame_pool_size)
+            self._pool = [None] * pool_size
+            self._rgb_pool = [None] * pool_size
+
+        slot = self._pool_idx
+        self._pool_idx = (self._pool_idx + 1) % len(self._pool)
+
+        if self._pool[slot] is None:
+            ok, frame = self._cap.read()
+        else:
+            # Двухаргументная форма декодирует кадр в уже выделенный буфер пула,
+            # не создавая новый ndarray на каждый кадр
+            ok, frame = self._cap.read(self._pool[slot])
+
         if not ok:
             raise CameraReadError("Не удалось прочитать кадр из источника")
 
-        if self.config.convert_to_rgb:
-            frame = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
+        self._pool[slot] = frame
+
+        with self._stats_lock:
+            if self._read_started is None:
+                self._read_started = time.monotonic()
+            self._frames_read += 1
+
+        if self._wants_rgb:
+            if self.config.defer_rgb_conversion:
+                frame = LazyRGBFrame(frame)
+            else:
+                if self._rgb_pool[slot] is None or self._rgb_pool[slot].shape != frame.shape:
+                    self._rgb_pool[slot] = np.empty_like(frame)
+
+                cv2.cvtColor(frame, cv2.COLOR_BGR2RGB, dst=self._rgb_pool[slot])
+                frame = self._rgb_pool[slot]
+
+        if copy:
+            frame = LazyRGBFrame(frame.bgr.copy()) if isinstance(frame, LazyRGBFrame) else frame.copy()
 
         return frame
 
@@ -110,19 +246,24 @@ class CameraFrameCapture(Iterable[np.ndarray]):
             except KeyboardInterrupt:
                 break
 
-    def save_frame(self, frame: np.ndarray, file_path: str | Path) -> Path:
+    def save_frame(self, frame: np.ndarray | LazyRGBFrame, file_path: str | Path) -> Path:
         """Сохраняет кадр по указанному пути
 
-        :param np.ndarray frame: Кадр для сохранения
+        :param np.ndarray | LazyRGBFrame frame: Кадр для сохранения
         :param str | Path file_path: Путь к файлу для сохранения
         :raises FrameSaveError: При ошибке сохранения кадра
         :return Path: Путь к сохраненному файлу
         """
         file_path.parent.mkdir(parents=True, exist_ok=True)
 
-        frame_to_save = frame.copy()
-        if self.config.convert_to_rgb:
-            frame_to_save = cv2.cvtColor(frame_to_save, cv2.COLOR_RGB2BGR)
+        if isinstance(frame, LazyRGBFrame):
+            # Кадр еще в BGR - сохраняем напрямую без обратной конвертации
+            frame_to_save = frame.bgr
+        elif self._wants_rgb:
+            # cvtColor выделяет новый буфер, поэтому исходный кадр не изменяется
+            frame_to_save = cv2.cvtColor(frame, cv2.COLOR_RGB2BGR)
+        else:
+            frame_to_save = frame
 
         success = cv2.imwrite(str(file_path), frame_to_save)
         if not success:
@@ -130,12 +271,27 @@ class CameraFrameCapture(Iterable[np.ndarray]):
 
         return file_path
 
-    def save_stream(self, save_path: str | Path, interval: float = 0.0, filename_prefix: str = "frame") -> tuple[Path, int]:
+    def save_stream(
+        self,
+        save_path: str | Path,
+        interval: float = 0.0,
+        filename_prefix: str = "frame",
+        threaded: bool = False,
+        prefetch: int = 8,
+        num_encoders: int = 2,
+        num_writers: int = 1,
+        verbose: bool = False,
+    ) -> tuple[Path, int]:
         """Сохраняет кадры из видеопотока с указанным интервалом времени
 
         :param str | Path save_path: Путь к директории для сохранения кадров
         :param float interval: Интервал времени между сохранениями в секундах. По умолчанию 0.0 (сохраняет каждый кадр)
         :param str filename_prefix: Префикс для имен файлов
+        :param bool threaded: Если True - считывание, кодирование и запись кадров выполняются в отдельных потоках
+        :param int prefetch: Размер очередей между потоками (только для threaded=True)
+        :param int num_encoders: Количество потоков кодирования JPEG (только для threaded=True)
+        :param int num_writers: Количество потоков записи на диск (только для threaded=True)
+        :param bool verbose: Периодически выводить метрики конвейера (см. stats(), только для threaded=True)
         :raises FrameSaveError: При ошибке сохранения кадра
         :return tuple[Path, int]: Путь до директории с кадрами, количество сохраненных кадров
         """
@@ -145,20 +301,31 @@ class CameraFrameCapture(Iterable[np.ndarray]):
         save_path = Path(save_path)
         save_path.mkdir(parents=True, exist_ok=True)
 
-        last_save_time = 0.0
+        if threaded:
+            return self._save_stream_threaded(
+                save_path, interval, filename_prefix, prefetch, num_encoders, num_writers, verbose)
+
         frame_count = 0
+        next_deadline = time.monotonic()
 
         while True:
             try:
-                current_time = time.time()
+                # Спим до следующего запланированного сохранения вместо
+                # активного опроса часов (monotonic не зависит от перевода времени)
+                now = time.monotonic()
+                if now < next_deadline:
+                    time.sleep(next_deadline - now)
 
-                # Проверка, прошло ли достаточно времени с последнего сохранения
-                if current_time - last_save_time >= interval:
-                    frame = self.read()
-                    filename = f"{filename_prefix}_{frame_count:06d}.jpg"
-                    self.save_frame(frame, save_path / filename)
-                    last_save_time = current_time
-                    frame_count += 1
+                frame = self.read()
+                filename = f"{filename_prefix}_{frame_count:06d}.jpg"
+                self.save_frame(frame, save_path / filename)
+                frame_count += 1
+
+                next_deadline += interval
+
+                # Пропускаем упущенные слоты, чтобы не копить догоняющие сохранения
+                if time.monotonic() - next_deadline > interval:
+                    next_deadline = time.monotonic() + interval
 
             except KeyboardInterrupt:
                 break
@@ -168,6 +335,214 @@ class CameraFrameCapture(Iterable[np.ndarray]):
 
         return save_path, frame_count
 
+    def _encode_frame(self, frame: np.ndarray | LazyRGBFrame) -> np.ndarray:
+        """Кодирует кадр в JPEG в памяти
+
+        В отличие от cv2.imwrite, cv2.imencode отпускает GIL на время кодирования,
+        поэтому несколько потоков-кодировщиков работают параллельно.
+
+        :param np.ndarray | LazyRGBFrame frame: Кадр для кодирования
+        :raises FrameSaveError: При ошибке кодирования кадра
+        :return np.ndarray: Закодированные JPEG-байты
+        """
+        if isinstance(frame, LazyRGBFrame):
+            frame = frame.bgr
+        elif self._wants_rgb:
+            frame = cv2.cvtColor(frame, cv2.COLOR_RGB2BGR)
+
+        ok, buffer = cv2.imencode('.jpg', frame, [int(cv2.IMWRITE_JPEG_QUALITY), self.config.jpeg_quality])
+        if not ok:
+            raise FrameSaveError("Не удалось закодировать кадр в JPEG")
+
+        return buffer
+
+    def _write_encoded(self, buffer: np.ndarray, file_path: Path) -> Path:
+        """Записывает закодированные JPEG-байты на диск
+
+        :param np.ndarray buffer: Закодированные JPEG-байты
+        :param Path file_path: Путь к файлу для сохранения
+        :raises FrameSaveError: При ошибке записи на диск
+        :return Path: Путь к сохраненному файлу
+        """
+        started = time.perf_counter()
+
+        try:
+            with open(file_path, 'wb') as file:
+                file.write(buffer.tobytes())
+        except OSError as error:
+            raise FrameSaveError(f"Не удалось сохранить кадр по пути: {file_path}") from error
+
+        latency_ms = (time.perf_counter() - started) * 1000.0
+        with self._stats_lock:
+            self._write_latency_ewma += self.EWMA_ALPHA * (latency_ms - self._write_latency_ewma)
+
+        return file_path
+
+    def _encode_and_write(self, frame: np.ndarray | LazyRGBFrame, file_path: str | Path) -> Path:
+        """Кодирует кадр в JPEG и записывает байты на диск
+
+        :param np.ndarray | LazyRGBFrame frame: Кадр для сохранения
+        :param str | Path file_path: Путь к файлу для сохранения
+        :raises FrameSaveError: При ошибке кодирования или записи кадра
+        :return Path: Путь к сохраненному файлу
+        """
+        return self._write_encoded(self._encode_frame(frame), Path(file_path))
+
+    def _save_stream_threaded(
+        self,
+        save_path: Path,
+        interval: float,
+        filename_prefix: str,
+        prefetch: int,
+        num_encoders: int,
+        num_writers: int,
+        verbose: bool = False,
+    ) -> tuple[Path, int]:
+        """Конвейерная версия save_stream: поток-читатель складывает кадры в ограниченную
+        очередь, пул кодировщиков выполняет cv2.imencode (отпускает GIL), поток записи
+        сбрасывает готовые JPEG-байты на диск. Считывание кадров не блокируется
+        кодированием и записью, поэтому внутренний буфер VideoCapture не переполняется.
+        Блокирующие put/get обеспечивают обратное давление без опроса очередей.
+
+        :param Path save_path: Путь к директории для сохранения кадров
+        :param float interval: Интервал времени между сохранениями в секундах
+        :param str filename_prefix: Префикс для имен файлов
+        :param int prefetch: Размер очередей между потоками
+        :param int num_encoders: Количество потоков кодирования JPEG
+        :param int num_writers: Количество потоков записи на диск
+        :param bool verbose: Периодически выводить метрики конвейера
+        :raises FrameSaveError: При ошибке сохранения кадра
+        :return tuple[Path, int]: Путь до директории с кадрами, количество сохраненных кадров
+        """
+        read_q: queue.Queue = queue.Queue(maxsize=prefetch)
+        write_q: queue.Queue = queue.Queue(maxsize=prefetch)
+        stop_event = threading.Event()
+        errors: list[Exception] = []
+        frame_count = 0
+
+        with self._stats_lock:
+            self._read_q = read_q
+            self._write_q = write_q
+            self._frames_read = 0
+            self._drops = 0
+            self._read_started = None
+
+        def reader() -> None:
+            nonlocal frame_count
+            next_deadline = time.monotonic()
+
+            while not stop_event.is_set():
+                try:
+                    # stop_event.wait вместо time.sleep, чтобы поток
+                    # просыпался сразу при остановке конвейера
+                    now = time.monotonic()
+                    if now < next_deadline and stop_event.wait(next_deadline - now):
+                        break
+
+                    # Копия обязательна: кадр в очереди должен пережить
+                    # ротацию буферного пула read()
+                    frame = self.read(copy=True)
+                    filename = f"{filename_prefix}_{frame_count:06d}.jpg"
+                    read_q.put((frame, save_path / filename))
+                    frame_count += 1
+
+                    # При interval=0 расписания нет - каждый кадр сохраняется
+                    # сразу и пропущенных слотов быть не может
+                    if interval > 0:
+                        next_deadline += interval
+                        if time.monotonic() - next_deadline > interval:
+                            with self._stats_lock:
+                                self._drops += 1
+                            next_deadline = time.monotonic() + interval
+
+                except CameraReadError:
+                    break
+
+        def encoder() -> None:
+            while True:
+                item = read_q.get()
+
+                if item is None:
+                    break
+
+                frame, file_path = item
+                try:
+                    write_q.put((self._encode_frame(frame), file_path))
+                except Exception as error:
+                    errors.append(error)
+                    # Останавливаем конвейер: без этого поток-читатель
+                    # продолжал бы съемку, молча ничего не сохраняя
+                    stop_event.set()
+
+        def writer() -> None:
+            while True:
+                item = write_q.get()
+
+                if item is None:
+                    break
+
+                buffer, file_path = item
+                try:
+                    self._write_encoded(buffer, file_path)
+                except Exception as error:
+                    errors.append(error)
+                    stop_event.set()
+
+        stats_timer: threading.Timer | None = None
+
+        def log_stats() -> None:
+            nonlocal stats_timer
+            print(self.stats())
+
+            if not stop_event.is_set():
+                stats_timer = threading.Timer(5.0, log_stats)
+                stats_timer.daemon = True
+                stats_timer.start()
+
+        encoders = [threading.Thread(target=encoder, daemon=True) for _ in range(num_encoders)]
+        writers = [threading.Thread(target=writer, daemon=True) for _ in range(num_writers)]
+        for thread in (*encoders, *writers):
+            thread.start()
+
+        reader_thread = threading.Thread(target=reader, daemon=True)
+        reader_thread.start()
+
+        if verbose:
+            stats_timer = threading.Timer(5.0, log_stats)
+            stats_timer.daemon = True
+            stats_timer.start()
+
+        try:
+            while reader_thread.is_alive():
+                reader_thread.join(timeout=0.1)
+        except KeyboardInterrupt:
+            pass
+        finally:
+            stop_event.set()
+            reader_thread.join()
+
+            for _ in encoders:
+                read_q.put(None)
+            for thread in encoders:
+                thread.join()
+
+            for _ in writers:
+                write_q.put(None)
+            for thread in writers:
+                thread.join()
+
+            if stats_timer is not None:
+                stats_timer.cancel()
+
+            with self._stats_lock:
+                self._read_q = None
+                self._write_q = None
+
+        if errors:
+            raise errors[0]
+
+        return save_path, frame_count
+
     def __enter__(self) -> "CameraFrameCapture":
         self.open()
         return self
@@ -180,5 +555,4 @@ class CameraFrameCapture(Iterable[np.ndarray]):
             self.open()
 
         while True:
-            frame = self.read()
-            yield frame
+            yield self.read(copy=self.config.copy_on_yield)
@@ -10,9 +10,28 @@ class CameraConfig:
     :param int | None height: Целевая высота кадра
     :param int | None fps: Целевая частота кадров
     :param bool convert_to_rgb: Конвертировать ли BGR в RGB
+    :param str | None pixel_format: Формат пикселей кадров ('GRAY', 'YUV', 'BGR', 'RGB').
+        Для 'GRAY' и 'YUV' конвертация отключается на уровне драйвера
+        (CAP_PROP_CONVERT_RGB=0), для 'BGR' кадр возвращается без cvtColor.
+        Если None - используется convert_to_rgb
+    :param bool defer_rgb_conversion: Откладывать ли конвертацию в RGB до первого обращения
+        к frame.rgb (read() возвращает LazyRGBFrame вместо np.ndarray)
+    :param int jpeg_quality: Качество JPEG при сохранении кадров (0-100)
+    :param bool copy_on_yield: Копировать ли кадры при итерации. read() переиспользует
+        внутренние буферы, поэтому потребители, удерживающие кадры дольше глубины
+        пула, должны включить этот флаг
+    :param int frame_pool_size: Количество переиспользуемых буферов кадров. Кадр,
+        возвращенный read(), валиден до тех пор, пока его буфер не ротируется обратно
+        (через frame_pool_size считываний) - размер пула должен быть не меньше
+        глубины конвейера потребителя
     """
     source: int | str = 0
     width: int | None = None
     height: int | None = None
     fps: int | None = None
     convert_to_rgb: bool = True
+    pixel_format: str | None = None
+    defer_rgb_conversion: bool = False
+    jpeg_quality: int = 95
+    copy_on_yield: bool = False
+    frame_pool_size: int = 4
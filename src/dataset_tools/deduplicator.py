@@ -1,18 +1,128 @@
+import itertools
 from pathlib import Path
+from concurrent.futures import ThreadPoolExecutor
 
+import numpy as np
 from imagededup.utils import plot_duplicates
 from imagededup.methods import CNN
 
+from .extensions import ImageExtensions
+
 
 class ImageDeduplicator:
 
-    def __init__(self, verbose: bool = False):
+    def __init__(self, verbose: bool = False, cache_path: str | Path | None = None):
+        """
+        :param bool verbose: Выводить ли прогресс работы CNN
+        :param str | Path | None cache_path: Путь к файлу кэша эмбеддингов (.npz).
+            Если указан - эмбеддинги сохраняются на диск и переиспользуются между запусками
+        """
         self.cnn = CNN(verbose)
         self.image_dir: str | None = None
         self.duplicates_map: dict[str, list[str]] | None = None
         self.files_with_duplicates: set[str] | None = None
         self.duplicates: set[str] | None = None
 
+        self._ordered_keys: tuple[str, ...] = ()
+        self.cache_path = Path(cache_path) if cache_path is not None else None
+        self._encodings: dict[str, np.ndarray] = {}
+        self._encoding_meta: dict[str, tuple[float, int]] = {}
+
+        self._load_cache()
+
+    def encode_images(self, image_dir: str | Path) -> dict[str, np.ndarray]:
+        """Вычисляет CNN-эмбеддинги изображений, переиспользуя кэш.
+
+        Прямой проход CNN выполняется только для файлов, у которых изменились
+        mtime или размер с момента последнего кодирования; остальные эмбеддинги
+        берутся из кэша. Записи удаленных файлов выбрасываются.
+
+        :param str | Path image_dir: Путь к директории с изображениями
+        :return dict[str, np.ndarray]: Словарь, где ключ - имя файла, значение - эмбеддинг
+        """
+        image_dir = Path(image_dir)
+        extensions = ImageExtensions.get_extensions()
+
+        current_meta: dict[str, tuple[float, int]] = {}
+        for file_path in image_dir.iterdir():
+            if file_path.is_file() and file_path.suffix.lower() in extensions:
+                stat = file_path.stat()
+                current_meta[file_path.name] = (stat.st_mtime, stat.st_size)
+
+        stale = [name for name, meta in current_meta.items() if self._encoding_meta.get(name) != meta]
+
+        if len(stale) == len(current_meta):
+            # Кэш пуст или полностью устарел - кодируем директорию целиком
+            encoded = self.cnn.encode_images(image_dir=str(image_dir))
+            self._encodings = {name: np.asarray(encoding).ravel() for name, encoding in encoded.items()}
+        else:
+            for name in stale:
+                encoding = self.cnn.encode_image(image_file=str(image_dir / name))
+                self._encodings[name] = np.asarray(encoding).ravel()
+
+        self._encodings = {name: self._encodings[name] for name in current_meta if name in self._encodings}
+        self._encoding_meta = {name: current_meta[name] for name in self._encodings}
+
+        self._save_cache()
+
+        return self._encodings
+
+    @staticmethod
+    def _duplicates_from_encodings(
+        encodings: dict[str, np.ndarray],
+        min_similarity_threshold: float,
+    ) -> dict[str, list[str]]:
+        """Строит карту дубликатов по косинусной близости эмбеддингов.
+
+        Матрица сходства вычисляется одним матричным произведением нормированных
+        эмбеддингов (BLAS) вместо попарного Python-цикла, поэтому повторный вызов
+        с другим порогом стоит O(N^2) в C поверх закэшированных эмбеддингов,
+        а не новый проход CNN.
+
+        :param dict[str, np.ndarray] encodings: Словарь, где ключ - имя файла, значение - эмбеддинг
+        :param float min_similarity_threshold: Минимальный порог схожести (0.0-1.0)
+        :return dict[str, list[str]]: Словарь, где ключ - имя файла, значения - список имен файлов дубликатов
+        """
+        names = list(encodings.keys())
+        duplicates_map: dict[str, list[str]] = {name: [] for name in names}
+
+        if len(names) < 2:
+            return duplicates_map
+
+        embeddings = np.stack([encodings[name] for name in names]).astype(np.float32)
+        embeddings /= np.linalg.norm(embeddings, axis=1, keepdims=True) + np.finfo(np.float32).eps
+
+        similarity = embeddings @ embeddings.T
+        np.fill_diagonal(similarity, 0.0)
+
+        for row, col in np.argwhere(similarity >= min_similarity_threshold):
+            duplicates_map[names[row]].append(names[col])
+
+        return duplicates_map
+
+    def _load_cache(self) -> None:
+        """Загружает кэш эмбеддингов с диска, если он существует"""
+
+        if self.cache_path is None or not self.cache_path.exists():
+            return
+
+        with np.load(self.cache_path, allow_pickle=True) as data:
+            for name, mtime, size in data['__meta__']:
+                self._encodings[name] = data[name]
+                self._encoding_meta[name] = (float(mtime), int(size))
+
+    def _save_cache(self) -> None:
+        """Сохраняет кэш эмбеддингов на диск"""
+
+        if self.cache_path is None:
+            return
+
+        meta = np.array(
+            [(name, *self._encoding_meta[name]) for name in self._encodings],
+            dtype=object,
+        )
+        np.savez_compressed(self.cache_path, __meta__=meta, **self._encodings)
+
     def find_duplicates(
         self,
         image_dir: str | Path,
@@ -26,20 +136,58 @@ class ImageDeduplicator:
         """
         self.image_dir = str(image_dir)
 
-        self.duplicates_map = self.cnn.find_duplicates(
-            image_dir=image_dir,
-            min_similarity_threshold=min_similarity_threshold,
+        self.duplicates_map = self._duplicates_from_encodings(
+            self.encode_images(image_dir),
+            min_similarity_threshold,
         )
 
-        self.files_with_duplicates = set()
-        self.duplicates = set()
+        self._cluster_duplicates()
+        self._ordered_keys = tuple(self.duplicates_map.keys())
+
+        return self.duplicates_map
+
+    def _cluster_duplicates(self) -> None:
+        """Группирует duplicates_map в кластеры через систему непересекающихся множеств.
+
+        Пары дубликатов в duplicates_map симметричны, поэтому наивный проход
+        добавлял один и тот же файл и в "оригиналы", и в "дубликаты". Union-find
+        объединяет связанные файлы в кластеры; первый файл кластера остается
+        каноническим представителем (files_with_duplicates), остальные попадают
+        в duplicates и подлежат удалению - ровно |кластер|-1 файлов на кластер.
+        """
+        parent: dict[str, str] = {}
+
+        def find(file: str) -> str:
+            root = file
+            while parent[root] != root:
+                root = parent[root]
+
+            # Сжатие путей
+            while parent[file] != root:
+                parent[file], file = root, parent[file]
+
+            return root
+
+        def union(first: str, second: str) -> None:
+            parent.setdefault(first, first)
+            parent.setdefault(second, second)
+
+            first_root, second_root = find(first), find(second)
+            if first_root != second_root:
+                parent[second_root] = first_root
 
         for file, duplicates in self.duplicates_map.items():
-            if len(duplicates) > 0:
-                self.files_with_duplicates.update(file)
-                self.duplicates.update(duplicates)
+            for duplicate in duplicates:
+                union(file, duplicate)
 
-        return self.duplicates_map
+        clusters: dict[str, list[str]] = {}
+        for file in parent:
+            clusters.setdefault(find(file), []).append(file)
+
+        # Плоская сборка множеств выполняется на уровне C-итерации,
+        # без повторных вызовов add/update в байткоде
+        self.files_with_duplicates = {members[0] for members in clusters.values()}
+        self.duplicates = set(itertools.chain.from_iterable(members[1:] for members in clusters.values()))
 
     def delete_duplicates(
         self,
@@ -62,20 +210,20 @@ class ImageDeduplicator:
         image_dir = Path(image_dir)
         labels_dir = Path(labels_dir) if labels_dir is not None else None
 
-        removed_files = []
+        paths_to_remove: list[Path] = []
         for file in self.duplicates:
-            image_path = image_dir / file
-            removed_files.append(str(image_path))
-
-            if not dry_run:
-                image_path.unlink()
+            paths_to_remove.append(image_dir / file)
 
             if labels_dir is not None:
-                label_path = labels_dir / Path(file).with_suffix('.txt')
-                removed_files.append(str(label_path))
+                paths_to_remove.append(labels_dir / Path(file).with_suffix('.txt'))
 
-                if not dry_run:
-                    label_path.unlink()
+        removed_files = [str(path) for path in paths_to_remove]
+
+        if not dry_run:
+            # Параллельные unlink-вызовы перекрывают задержки файловой системы
+            # вместо последовательного ожидания каждого syscall
+            with ThreadPoolExecutor(max_workers=16) as executor:
+                list(executor.map(lambda path: path.unlink(missing_ok=True), paths_to_remove))
 
         if not dry_run:
             self.duplicates_map = None
@@ -97,10 +245,7 @@ class ImageDeduplicator:
                 "Не найден словарь дубликатов. Сначала вызовите find_duplicates()"
             )
 
-        if isinstance(target, int):
-            filename = self.files_with_duplicates[target]
-        else:
-            filename = str(filename)
+        filename = self._ordered_keys[target] if isinstance(target, int) else str(target)
 
         plot_duplicates(
             image_dir=self.image_dir,
@@ -1,7 +1,13 @@
 import os
+import mmap
+import queue
+import threading
 from pathlib import Path
 from dataclasses import dataclass
+from collections.abc import Iterator
 
+import cv2
+import numpy as np
 from PIL import Image
 from tqdm import tqdm
 
@@ -27,6 +33,13 @@ class CleanupResult:
 
 class ImageValidator:
 
+    JPEG_SOI = b"\xff\xd8"
+    JPEG_EOI = b"\xff\xd9"
+    PNG_SIGNATURE = b"\x89PNG\r\n\x1a\n"
+
+    # Файлы крупнее этого размера верифицируются через mmap
+    MMAP_THRESHOLD = 1024 * 1024
+
     def __init__(self, extensions: set[str] | None = None):
         self.extensions = extensions or ImageExtensions.get_extensions()
         self.extensions = normalize_extensions(self.extensions)
@@ -34,28 +47,122 @@ class ImageValidator:
     def is_corrupted(self, image_path: str | Path) -> bool:
         """ Проверяет, является ли изображение поврежденным
 
+        Для JPEG и PNG сначала выполняется быстрая структурная проверка по сигнатуре
+        и завершающим маркерам файла: совпадение маркеров принимает файл без
+        декодирования. Проверка маркеров - только быстрый положительный ответ:
+        при несовпадении (например, мусорные байты после EOI от камер и
+        EXIF-редакторов) решает пробное декодирование уменьшенной копии через
+        cv2.imdecode (SIMD-путь libjpeg-turbo). Для остальных форматов
+        используется полная верификация через PIL.
+
         :param str | Path image_path: Путь к изображению
         :return: True если изображение валидно, False иначе
         """
+        suffix = Path(image_path).suffix.lower()
+
         try:
-            with Image.open(str(image_path)) as img:
-                img.verify()
+            if suffix in {'.jpg', '.jpeg', '.png'}:
+                return self._fast_is_corrupted(image_path) or self._is_decodable(image_path)
 
-            return True
+            return self._pil_verify(image_path)
 
         except Exception:
             return False
 
+    def _pil_verify(self, image_path: str | Path) -> bool:
+        """ Верифицирует изображение через PIL
+
+        Крупные файлы отображаются в память через mmap: verify() читает только
+        заголовок, поэтому ядро подгружает лишь первые страницы файла вместо
+        множества буферизованных fread-вызовов.
+
+        :param str | Path image_path: Путь к изображению
+        :return: True если изображение валидно
+        """
+        if os.path.getsize(image_path) > self.MMAP_THRESHOLD:
+            with open(image_path, 'rb') as file, mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+                with Image.open(mapped) as img:
+                    img.verify()
+        else:
+            with Image.open(str(image_path)) as img:
+                img.verify()
+
+        return True
+
+    def _fast_is_corrupted(self, image_path: str | Path) -> bool:
+        """ Проверяет структуру файла по магическим числам и завершающим маркерам
+
+        Ответ False не означает повреждение: валидные файлы нередко содержат
+        байты после завершающего маркера, поэтому несовпадение - лишь повод
+        для более дорогой проверки декодированием.
+
+        :param str | Path image_path: Путь к изображению
+        :return: True если структура файла заведомо корректна, False если нужна
+            проверка декодированием
+        """
+        with open(image_path, 'rb') as file:
+            header = file.read(12)
+            tail_window = min(64, os.path.getsize(image_path))
+
+            # JPEG: файл начинается с SOI, маркер EOI - в хвостовом окне
+            # (после EOI допускаются мусорные байты)
+            if header.startswith(self.JPEG_SOI):
+                file.seek(-tail_window, os.SEEK_END)
+                return self.JPEG_EOI in file.read()
+
+            # PNG: 8-байтовая сигнатура и чанк IEND в хвостовом окне
+            if header.startswith(self.PNG_SIGNATURE):
+                file.seek(-tail_window, os.SEEK_END)
+                return b'IEND' in file.read()
+
+        return False
+
+    @staticmethod
+    def _is_decodable(image_path: str | Path) -> bool:
+        """ Проверяет, что изображение успешно декодируется
+
+        IMREAD_REDUCED_COLOR_8 декодирует уменьшенную в 8 раз копию - этого
+        достаточно для подтверждения декодируемости при доле затрат CPU.
+
+        :param str | Path image_path: Путь к изображению
+        :return: True если изображение декодируется, False иначе
+        """
+        data = np.fromfile(str(image_path), dtype=np.uint8)
+        image = cv2.imdecode(data, cv2.IMREAD_REDUCED_COLOR_8)
+
+        return image is not None and image.size > 0
+
     def find_image_files(self, dir_path: str | Path) -> list[Path]:
         """ Находит все файлы изображений в директории
 
         :param str | Path dir_path: Директория для поиска
         :return list[Path]: Список путей к файлам изображений
         """
-        return [
-            file_path for file_path in Path(dir_path).rglob('*')
-            if file_path.is_file() and file_path.suffix.lower() in self.extensions
-        ]
+        return list(self._iter_image_files(dir_path))
+
+    def _iter_image_files(self, dir_path: str | Path) -> Iterator[Path]:
+        """ Итерирует по файлам изображений в директории
+
+        Обход выполняется итеративно через os.scandir: тип записи берется
+        из результата readdir без дополнительных stat-вызовов, а объекты
+        Path создаются только для подходящих файлов.
+
+        :param str | Path dir_path: Директория для поиска
+        :return Iterator[Path]: Пути к файлам изображений
+        """
+        extensions = frozenset(self.extensions)
+
+        stack = [str(dir_path)]
+        while stack:
+            with os.scandir(stack.pop()) as entries:
+                for entry in entries:
+                    if entry.is_dir(follow_symlinks=False):
+                        stack.append(entry.path)
+
+                    elif entry.is_file(follow_symlinks=False):
+                        dot_index = entry.name.rfind('.')
+                        if dot_index != -1 and entry.name[dot_index:].lower() in extensions:
+                            yield Path(entry.path)
 
     def cleanup_corrupted_images(
         self,
@@ -75,24 +182,95 @@ class ImageValidator:
         if not images_dir.exists():
             raise FileNotFoundError(f"Директория не найдена: {images_dir}")
 
-        image_files = self.find_image_files(images_dir)
-        removed_files = []
+        # Трехстадийный конвейер: обход директорий, пул проверяющих потоков и
+        # поток удаления связаны ограниченными очередями. Обход и unlink
+        # перекрываются с проверкой, общее время равно самой медленной стадии
+        walk_q: queue.Queue = queue.Queue(maxsize=1024)
+        verify_q: queue.Queue = queue.Queue(maxsize=1024)
+        num_verifiers = (os.cpu_count() or 1) * 2
+
+        removed_files: list[Path] = []
+        errors: list[Exception] = []
+        total_processed = 0
+        counter_lock = threading.Lock()
+        progress = tqdm(desc="Проверка изображений", unit="файл")
+
+        def walker() -> None:
+            try:
+                for file_path in self._iter_image_files(images_dir):
+                    walk_q.put(file_path)
+            except Exception as error:
+                errors.append(error)
+            finally:
+                # Сентинели отправляются даже при ошибке обхода,
+                # иначе проверяющие потоки никогда не завершатся
+                for _ in range(num_verifiers):
+                    walk_q.put(None)
+
+        def verifier() -> None:
+            nonlocal total_processed
+
+            while True:
+                file_path = walk_q.get()
+
+                if file_path is None:
+                    break
+
+                is_valid = self.is_corrupted(file_path)
+
+                with counter_lock:
+                    total_processed += 1
+                progress.update(1)
+
+                if not is_valid:
+                    verify_q.put(file_path)
+
+        def deleter() -> None:
+            failed = False
+
+            while True:
+                file_path = verify_q.get()
+
+                if file_path is None:
+                    break
+
+                # После ошибки очередь продолжает вычитываться вхолостую,
+                # чтобы проверяющие потоки не зависли на put
+                if failed:
+                    continue
+
+                try:
+                    if not dry_run:
+                        os.remove(file_path)
+                    removed_files.append(file_path)
+
+                    if verbose:
+                        action = "Будет удален" if dry_run else "Удален"
+                        print(f'{action}: {file_path}')
+                except Exception as error:
+                    errors.append(error)
+                    failed = True
+
+        walker_thread = threading.Thread(target=walker, daemon=True)
+        verifier_threads = [threading.Thread(target=verifier, daemon=True) for _ in range(num_verifiers)]
+        deleter_thread = threading.Thread(target=deleter, daemon=True)
+
+        for thread in (walker_thread, *verifier_threads, deleter_thread):
+            thread.start()
 
-        if verbose:
-            print(f"Найдено {len(image_files)} файлов изображений для проверки")
+        walker_thread.join()
+        for thread in verifier_threads:
+            thread.join()
 
-        for image_path in tqdm(image_files, desc="Проверка изображений"):
-            if not self.is_corrupted(image_path):
-                if not dry_run:
-                    os.remove(image_path)
-                removed_files.append(image_path)
+        verify_q.put(None)
+        deleter_thread.join()
+        progress.close()
 
-                if verbose:
-                    action = "Будет удален" if dry_run else "Удален"
-                    print(f'{action}: {image_path}')
+        if errors:
+            raise errors[0]
 
         result = CleanupResult(
-            total_processed=len(image_files),
+            total_processed=total_processed,
             corrupted_removed=len(removed_files),
             removed_files=removed_files
         )